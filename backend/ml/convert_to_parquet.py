@@ -0,0 +1,31 @@
+"""
+One-shot CSV → Parquet conversion for the pattern learning dataset.
+
+Parquet loads several times faster than CSV (no text parsing, multithreaded
+columnar decode) and dictionary-encodes the repeated 'Stock' values.
+
+Usage:
+    python convert_to_parquet.py [input.csv] [output.parquet]
+
+Defaults:
+    ../stocks_df.csv → ../stocks_df.parquet
+"""
+
+import sys
+import pandas as pd
+
+
+def convert(csv_path: str, parquet_path: str):
+    """Read the CSV once and write it as zstd-compressed Parquet."""
+    print(f"Reading {csv_path}...")
+    df = pd.read_csv(csv_path)
+    
+    print(f"Writing {len(df):,} rows to {parquet_path}...")
+    df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+    print("Done.")
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else "../stocks_df.csv"
+    parquet_path = sys.argv[2] if len(sys.argv) > 2 else "../stocks_df.parquet"
+    convert(csv_path, parquet_path)
@@ -5,141 +5,550 @@ Extracts behavioral features from OHLCV data using sliding windows.
 Optimized for processing millions of rows efficiently.
 """
 
+import os
+
 import pandas as pd
 import numpy as np
+from joblib import Parallel, delayed
+from numpy.lib.stride_tricks import sliding_window_view
+from numba import njit, prange
+
+
+FEATURE_COLUMNS = [
+    'volatility_5d', 'volatility_10d', 'volatility_20d',
+    'trend_slope_10d', 'trend_slope_20d',
+    'drawdown_20d',
+    'volume_ratio_10d', 'volume_ratio_20d',
+    'range_compression_10d',
+    'momentum_5d', 'momentum_10d',
+]
+
+
+def _rolling(series: pd.Series, window: int, groups: pd.Series = None):
+    """
+    Rolling window over a series, optionally restarted at every group boundary.
+    Rows of each group must be contiguous (the batch pipeline sorts once by stock).
+    """
+    if groups is None:
+        return series.rolling(window=window, min_periods=window)
+    return series.groupby(groups, sort=False).rolling(window=window, min_periods=window)
+
+
+def _ungroup(result: pd.Series, groups: pd.Series = None) -> pd.Series:
+    """Drop the group level added by a grouped rolling op."""
+    if groups is None:
+        return result
+    return result.reset_index(level=0, drop=True)
 
 
-def calculate_log_returns(close: pd.Series) -> pd.Series:
-    """Calculate log returns from close prices."""
-    return np.log(close / close.shift(1))
+def _mask_group_starts(result: np.ndarray, window: int, groups: pd.Series = None) -> np.ndarray:
+    """
+    Blank windows that span a stock boundary (the first window-1 rows of each
+    stock) in a kernel result computed over the whole sorted frame.
+    """
+    if groups is not None:
+        position_in_group = groups.groupby(groups, sort=False).cumcount().to_numpy()
+        result[position_in_group < window - 1] = np.nan
+    return result
 
 
-def calculate_volatility(returns: pd.Series, window: int) -> pd.Series:
+def calculate_log_returns(close: pd.Series, groups: pd.Series = None) -> pd.Series:
+    """
+    Calculate log returns from close prices.
+    Takes log(close) once and differences neighbours, keeping the input dtype.
+    """
+    log_close = np.log(close.to_numpy())
+    returns = np.empty_like(log_close)
+    returns[:1] = np.nan
+    returns[1:] = log_close[1:] - log_close[:-1]
+    if groups is not None and len(returns):
+        # No return across a stock boundary
+        returns[_group_starts(groups)[:-1]] = np.nan
+    return pd.Series(returns, index=close.index)
+
+
+def calculate_volatility(returns: pd.Series, window: int, groups: pd.Series = None) -> pd.Series:
     """Rolling standard deviation of returns (realized volatility)."""
-    return returns.rolling(window=window, min_periods=window).std()
+    return _ungroup(_rolling(returns, window, groups).std(), groups)
 
 
-def calculate_trend_slope_fast(close: pd.Series, window: int) -> pd.Series:
+@njit(cache=True)
+def _trend_slope_into(y: np.ndarray, window: int, out: np.ndarray):
     """
-    Fast linear regression slope using numpy.
-    Uses the formula: slope = (n*sum(xy) - sum(x)*sum(y)) / (n*sum(x^2) - sum(x)^2)
+    Rolling linear regression slope in a single pass, written into out.
+    Keeps running sum(y) and sum(xy) with x = 0..window-1 relative to the window,
+    so each step is an O(1) update. Windows containing a non-finite value
+    (NaN or ±inf) yield NaN; such values never enter the running sums.
     """
-    y = close.values
     n = len(y)
-    result = np.full(n, np.nan)
+    out[:] = np.nan
+    if n < window:
+        return
+    
+    sum_x = window * (window - 1) / 2.0
+    sum_x_sq = (window - 1) * window * (2 * window - 1) / 6.0
+    denominator = window * sum_x_sq - sum_x ** 2
+    
+    sum_y = 0.0
+    sum_xy = 0.0
+    missing_count = 0
+    for k in range(window):
+        v = y[k]
+        if not np.isfinite(v):
+            missing_count += 1
+        else:
+            sum_y += v
+            sum_xy += k * v
+    if missing_count == 0:
+        out[window - 1] = (window * sum_xy - sum_x * sum_y) / denominator
     
+    for i in range(window, n):
+        v_in = y[i]
+        v_out = y[i - window]
+        if not np.isfinite(v_in):
+            missing_count += 1
+            v_in = 0.0
+        if not np.isfinite(v_out):
+            missing_count -= 1
+            v_out = 0.0
+        # Every remaining element shifts one position left (x decreases by 1)
+        sum_xy += (window - 1) * v_in - (sum_y - v_out)
+        sum_y += v_in - v_out
+        if missing_count == 0:
+            out[i] = (window * sum_xy - sum_x * sum_y) / denominator
+
+
+def _windowed_dot(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Dot product of every trailing window with a fixed weight vector, as one
+    matrix-vector product over a strided sliding-window view (no copy of the
+    windows). Windows containing NaN yield NaN; the first len(weights)-1 rows are NaN.
+    """
+    window = len(weights)
+    result = np.full(len(values), np.nan)
+    if len(values) >= window:
+        result[window - 1:] = sliding_window_view(values, window) @ weights
+    return result
+
+
+def calculate_trend_slope_fast(close: pd.Series, window: int, groups: pd.Series = None) -> pd.Series:
+    """
+    Fast linear regression slope as a single matrix-vector product.
+    slope = (n*sum(xy) - sum(x)*sum(y)) / (n*sum(x^2) - sum(x)^2) is linear in y,
+    so it equals y_window @ coef with coef = (n*x - sum(x)) / denominator.
+    """
     # Precompute x values (0, 1, 2, ..., window-1)
-    x = np.arange(window)
-    sum_x = x.sum()
-    sum_x_sq = (x ** 2).sum()
-    
-    for i in range(window - 1, n):
-        y_window = y[i - window + 1:i + 1]
-        if np.isnan(y_window).any():
-            continue
-        sum_y = y_window.sum()
-        sum_xy = (x * y_window).sum()
-        
-        denominator = window * sum_x_sq - sum_x ** 2
-        if denominator != 0:
-            result[i] = (window * sum_xy - sum_x * sum_y) / denominator
+    x = np.arange(window, dtype=np.float64)
+    denominator = window * (x ** 2).sum() - x.sum() ** 2
+    coef = (window * x - x.sum()) / denominator
     
+    y = close.to_numpy(dtype=np.float64)
+    result = _mask_group_starts(_windowed_dot(y, coef), window, groups)
     return pd.Series(result, index=close.index)
 
 
-def calculate_drawdown(close: pd.Series, window: int) -> pd.Series:
+@njit(cache=True)
+def _rolling_max_into(x: np.ndarray, window: int, out: np.ndarray):
+    """
+    Sliding-window maximum with a monotonic deque of indices (amortized O(1)
+    per step). The deque is a ring buffer of length window: once expired
+    indices are dropped it never holds more than window entries.
+    Windows containing NaN yield NaN.
+    """
+    deque = np.empty(window, dtype=np.int64)
+    head = 0
+    count = 0
+    last_nan = -1
+    for i in range(len(x)):
+        # Drop indices that have left the window from the front
+        while count > 0 and deque[head] <= i - window:
+            head = (head + 1) % window
+            count -= 1
+        v = x[i]
+        if np.isnan(v):
+            last_nan = i
+        else:
+            # Drop smaller values from the back: they can never be the max again
+            while count > 0 and x[deque[(head + count - 1) % window]] <= v:
+                count -= 1
+            deque[(head + count) % window] = i
+            count += 1
+        if i >= window - 1 and last_nan <= i - window:
+            out[i] = x[deque[head]]
+        else:
+            out[i] = np.nan
+
+
+@njit(cache=True)
+def rolling_max_deque(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling maximum (see _rolling_max_into)."""
+    result = np.empty(len(x))
+    _rolling_max_into(x, window, result)
+    return result
+
+
+def calculate_drawdown(close: pd.Series, window: int, groups: pd.Series = None) -> pd.Series:
     """Drawdown from rolling maximum."""
-    rolling_max = close.rolling(window=window, min_periods=window).max()
-    return (close - rolling_max) / rolling_max
+    values = np.ascontiguousarray(close.to_numpy(dtype=np.float64))
+    rolling_max = _mask_group_starts(rolling_max_deque(values, window), window, groups)
+    return pd.Series((values - rolling_max) / rolling_max, index=close.index)
 
 
-def calculate_volume_ratio(volume: pd.Series, window: int) -> pd.Series:
+def _safe_ratio(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+    """
+    numerator / denominator, NaN where the denominator is zero.
+    Divides straight into the output array instead of copying the denominator
+    to replace zeros.
+    """
+    num = numerator.to_numpy()
+    den = denominator.to_numpy()
+    result = np.full(len(num), np.nan)
+    np.divide(num, den, out=result, where=den != 0)
+    return pd.Series(result, index=numerator.index)
+
+
+def calculate_volume_ratio(volume: pd.Series, window: int, groups: pd.Series = None) -> pd.Series:
     """Current volume vs rolling average."""
-    avg_volume = volume.rolling(window=window, min_periods=window).mean()
-    # Avoid division by zero
-    return volume / avg_volume.replace(0, np.nan)
+    avg_volume = _ungroup(_rolling(volume, window, groups).mean(), groups)
+    return _safe_ratio(volume, avg_volume)
 
 
-def calculate_range_compression(high: pd.Series, low: pd.Series, window: int) -> pd.Series:
+def calculate_range_compression(high: pd.Series, low: pd.Series, window: int,
+                                groups: pd.Series = None) -> pd.Series:
     """Current price range vs rolling average range."""
     daily_range = high - low
-    avg_range = daily_range.rolling(window=window, min_periods=window).mean()
-    return daily_range / avg_range.replace(0, np.nan)
+    avg_range = _ungroup(_rolling(daily_range, window, groups).mean(), groups)
+    return _safe_ratio(daily_range, avg_range)
+
+
+def calculate_momentum(returns: pd.Series, window: int, groups: pd.Series = None) -> pd.Series:
+    """
+    Sum of returns over window.
+    No group masking needed: each stock's first return is NaN, so windows
+    crossing a stock boundary are already NaN.
+    """
+    result = _windowed_dot(returns.to_numpy(dtype=np.float64), np.ones(window))
+    return pd.Series(result, index=returns.index)
+
+
+@njit(cache=True)
+def _rolling_sum_into(x: np.ndarray, window: int, out: np.ndarray):
+    """
+    Running-sum rolling window. Windows containing a non-finite value (NaN or
+    ±inf, e.g. the log return next to a zero close) yield NaN; such values
+    never enter the running sum, so later windows recover.
+    """
+    total = 0.0
+    missing_count = 0
+    for i in range(len(x)):
+        v = x[i]
+        if not np.isfinite(v):
+            missing_count += 1
+        else:
+            total += v
+        if i >= window:
+            v = x[i - window]
+            if not np.isfinite(v):
+                missing_count -= 1
+            else:
+                total -= v
+        out[i] = total if i >= window - 1 and missing_count == 0 else np.nan
+
+
+@njit(cache=True)
+def _rolling_std_into(x: np.ndarray, window: int, out: np.ndarray):
+    """
+    Running sum / sum of squares rolling sample std (ddof=1).
+    Non-finite values are treated as missing, as in _rolling_sum_into.
+    """
+    total = 0.0
+    total_sq = 0.0
+    missing_count = 0
+    for i in range(len(x)):
+        v = x[i]
+        if not np.isfinite(v):
+            missing_count += 1
+        else:
+            total += v
+            total_sq += v * v
+        if i >= window:
+            v = x[i - window]
+            if not np.isfinite(v):
+                missing_count -= 1
+            else:
+                total -= v
+                total_sq -= v * v
+        if i >= window - 1 and missing_count == 0:
+            var = (total_sq - total * total / window) / (window - 1)
+            # Float residue can leave a tiny negative variance for flat windows
+            if var < 0.0:
+                var = 0.0
+            out[i] = np.sqrt(var)
+        else:
+            out[i] = np.nan
+
+
+@njit(cache=True)
+def _rolling_ratio_into(x: np.ndarray, window: int, out: np.ndarray):
+    """
+    Current value vs rolling mean. A window of all zeros has no meaningful
+    mean, so it yields NaN (tracked by count to avoid float residue).
+    Non-finite values are treated as missing, as in _rolling_sum_into.
+    """
+    total = 0.0
+    missing_count = 0
+    nonzero_count = 0
+    for i in range(len(x)):
+        v = x[i]
+        if not np.isfinite(v):
+            missing_count += 1
+        else:
+            total += v
+            if v != 0.0:
+                nonzero_count += 1
+        if i >= window:
+            v = x[i - window]
+            if not np.isfinite(v):
+                missing_count -= 1
+            else:
+                total -= v
+                if v != 0.0:
+                    nonzero_count -= 1
+        if i >= window - 1 and missing_count == 0 and nonzero_count > 0:
+            out[i] = x[i] / (total / window)
+        else:
+            out[i] = np.nan
 
 
-def calculate_momentum(returns: pd.Series, window: int) -> pd.Series:
-    """Sum of returns over window."""
-    return returns.rolling(window=window, min_periods=window).sum()
+@njit(cache=True)
+def _drawdown_into(close: np.ndarray, window: int, out: np.ndarray):
+    """Drawdown from rolling maximum, written into out."""
+    _rolling_max_into(close, window, out)
+    for i in range(len(close)):
+        peak = out[i]
+        # A zero peak (all-zero closes) has no defined drawdown
+        out[i] = (close[i] - peak) / peak if peak != 0.0 else np.nan
 
 
-def extract_features(df: pd.DataFrame) -> pd.DataFrame:
+@njit(cache=True)
+def _stock_features_into(close, high, low, volume, out):
+    """
+    All features for one stock's rows, written into the columns of out
+    (ordered as FEATURE_COLUMNS). The stock's slice stays cache-resident
+    while every rolling window is swept over it.
+    """
+    n = len(close)
+    returns = np.empty(n)
+    daily_range = np.empty(n)
+    column = np.empty(n)
+    
+    prev_log = np.nan
+    for i in range(n):
+        log_close = np.log(close[i])
+        returns[i] = log_close - prev_log
+        prev_log = log_close
+        daily_range[i] = high[i] - low[i]
+    
+    _rolling_std_into(returns, 5, column)
+    out[:, 0] = column
+    _rolling_std_into(returns, 10, column)
+    out[:, 1] = column
+    _rolling_std_into(returns, 20, column)
+    out[:, 2] = column
+    _trend_slope_into(close, 10, column)
+    out[:, 3] = column
+    _trend_slope_into(close, 20, column)
+    out[:, 4] = column
+    _drawdown_into(close, 20, column)
+    out[:, 5] = column
+    _rolling_ratio_into(volume, 10, column)
+    out[:, 6] = column
+    _rolling_ratio_into(volume, 20, column)
+    out[:, 7] = column
+    _rolling_ratio_into(daily_range, 10, column)
+    out[:, 8] = column
+    _rolling_sum_into(returns, 5, column)
+    out[:, 9] = column
+    _rolling_sum_into(returns, 10, column)
+    out[:, 10] = column
+
+
+@njit(parallel=True, cache=True)
+def _features_kernel(close, high, low, volume, starts):
+    """Fused feature kernel, parallel over stocks (rows starts[g]:starts[g+1])."""
+    out = np.empty((len(close), 11), dtype=np.float32)
+    for g in prange(len(starts) - 1):
+        a = starts[g]
+        b = starts[g + 1]
+        _stock_features_into(close[a:b], high[a:b], low[a:b], volume[a:b], out[a:b])
+    return out
+
+
+def _group_keys(stocks: pd.Series) -> pd.Series:
+    """Integer group keys for a stock column (its codes when categorical)."""
+    if isinstance(stocks.dtype, pd.CategoricalDtype):
+        return stocks.cat.codes
+    return stocks
+
+
+def _group_starts(stocks: pd.Series) -> np.ndarray:
+    """Row offsets where each contiguous stock block begins, plus the total length."""
+    values = _group_keys(stocks).to_numpy()
+    boundaries = np.flatnonzero(values[1:] != values[:-1]) + 1
+    return np.concatenate(([0], boundaries, [len(values)])).astype(np.int64)
+
+
+def _extract_features_numba(df: pd.DataFrame, stock_column: str = None) -> pd.DataFrame:
+    """
+    Extract all features with the fused numba kernel.
+    No copy is made for columns that are already float32 (see prepare_features).
+    """
+    close = np.ascontiguousarray(df['Close'], dtype=np.float32)
+    high = np.ascontiguousarray(df['High'], dtype=np.float32)
+    low = np.ascontiguousarray(df['Low'], dtype=np.float32)
+    volume = np.ascontiguousarray(df['Volume'], dtype=np.float32)
+    if stock_column:
+        starts = _group_starts(df[stock_column])
+    else:
+        starts = np.array([0, len(df)], dtype=np.int64)
+    
+    values = _features_kernel(close, high, low, volume, starts)
+    
+    features = pd.DataFrame(values, index=df.index, columns=FEATURE_COLUMNS)
+    features.insert(0, 'date', df['Date'])
+    return features
+
+
+def extract_features(df: pd.DataFrame, stock_column: str = None,
+                     engine: str = 'numba') -> pd.DataFrame:
     """
     Extract all features for a single stock's data.
-    Optimized version with vectorized operations.
+    If stock_column is given, df may hold many stocks (sorted by stock, then date)
+    and every rolling window restarts at each stock boundary.
+    engine='numba' runs the fused kernel; engine='pandas' uses the per-feature
+    helpers above (one rolling op per feature).
     """
-    close = df['Close'].astype(float)
-    high = df['High'].astype(float)
-    low = df['Low'].astype(float)
-    volume = df['Volume'].astype(float)
+    if engine == 'numba':
+        return _extract_features_numba(df, stock_column)
+    if engine != 'pandas':
+        raise ValueError(f"Unknown engine: {engine}")
+    
+    close = df['Close']
+    high = df['High']
+    low = df['Low']
+    volume = df['Volume']
+    groups = _group_keys(df[stock_column]) if stock_column else None
     
     # Calculate log returns first
-    returns = calculate_log_returns(close)
+    returns = calculate_log_returns(close, groups)
     
     features = pd.DataFrame(index=df.index)
     features['date'] = df['Date']
     
     # Volatility features (fast)
-    features['volatility_5d'] = calculate_volatility(returns, 5)
-    features['volatility_10d'] = calculate_volatility(returns, 10)
-    features['volatility_20d'] = calculate_volatility(returns, 20)
+    features['volatility_5d'] = calculate_volatility(returns, 5, groups)
+    features['volatility_10d'] = calculate_volatility(returns, 10, groups)
+    features['volatility_20d'] = calculate_volatility(returns, 20, groups)
     
     # Trend features (optimized)
-    features['trend_slope_10d'] = calculate_trend_slope_fast(close, 10)
-    features['trend_slope_20d'] = calculate_trend_slope_fast(close, 20)
+    features['trend_slope_10d'] = calculate_trend_slope_fast(close, 10, groups)
+    features['trend_slope_20d'] = calculate_trend_slope_fast(close, 20, groups)
     
     # Drawdown
-    features['drawdown_20d'] = calculate_drawdown(close, 20)
+    features['drawdown_20d'] = calculate_drawdown(close, 20, groups)
     
     # Volume behavior
-    features['volume_ratio_10d'] = calculate_volume_ratio(volume, 10)
-    features['volume_ratio_20d'] = calculate_volume_ratio(volume, 20)
+    features['volume_ratio_10d'] = calculate_volume_ratio(volume, 10, groups)
+    features['volume_ratio_20d'] = calculate_volume_ratio(volume, 20, groups)
     
     # Range compression/expansion
-    features['range_compression_10d'] = calculate_range_compression(high, low, 10)
+    features['range_compression_10d'] = calculate_range_compression(high, low, 10, groups)
     
     # Momentum
-    features['momentum_5d'] = calculate_momentum(returns, 5)
-    features['momentum_10d'] = calculate_momentum(returns, 10)
+    features['momentum_5d'] = calculate_momentum(returns, 5, groups)
+    features['momentum_10d'] = calculate_momentum(returns, 10, groups)
     
     return features
 
 
-def extract_features_batch(df: pd.DataFrame, stock_column: str = 'Stock') -> pd.DataFrame:
+def _is_sorted_by_stock_and_date(df: pd.DataFrame, stock_column: str) -> bool:
+    """
+    O(n) check for (stock, date) order, so already-ordered OHLCV files skip
+    the O(n log n) sort. Missing dates can't be compared, so they always
+    fall back to the sort.
+    """
+    if df['Date'].isna().any():
+        return False
+    stocks = _group_keys(df[stock_column]).to_numpy()
+    dates = df['Date'].to_numpy()
+    same_stock = stocks[1:] == stocks[:-1]
+    return bool(
+        np.all(stocks[1:] >= stocks[:-1])
+        and np.all(dates[1:][same_stock] >= dates[:-1][same_stock])
+    )
+
+
+def _balance_stock_chunks(sizes: np.ndarray, n_chunks: int) -> list:
+    """
+    Split stocks (given by their row counts) into n_chunks lists of stock
+    positions with similar total row count. Largest stocks are placed first,
+    each into the currently lightest chunk.
+    """
+    chunks = [[] for _ in range(n_chunks)]
+    loads = np.zeros(n_chunks, dtype=np.int64)
+    for stock in np.argsort(sizes, kind='stable')[::-1]:
+        target = int(np.argmin(loads))
+        chunks[target].append(stock)
+        loads[target] += sizes[stock]
+    return [sorted(c) for c in chunks if c]
+
+
+def _extract_chunk(df: pd.DataFrame, stock_column: str, engine: str = 'numba') -> pd.DataFrame:
+    """Extract features for a chunk of whole stocks (runs in a worker process)."""
+    features = extract_features(df, stock_column, engine)
+    features['stock'] = df[stock_column]
+    return features
+
+
+def extract_features_batch(df: pd.DataFrame, stock_column: str = 'Stock',
+                           n_jobs: int = None, engine: str = 'numba') -> pd.DataFrame:
     """
     Extract features for all stocks in dataset.
-    Optimized with progress tracking.
-    """
-    all_features = []
-    stocks = df[stock_column].unique()
-    total = len(stocks)
-    
-    print(f"Processing {total} stocks...")
-    
-    for i, stock in enumerate(stocks):
-        # Progress every 50 stocks
-        if i % 50 == 0:
-            pct = (i / total) * 100
-            print(f"  Progress: {i}/{total} ({pct:.1f}%)")
-        
-        stock_data = df[df[stock_column] == stock].copy()
-        stock_data = stock_data.sort_values('Date')
-        
-        features = extract_features(stock_data)
-        features['stock'] = stock
-        all_features.append(features)
-    
-    print(f"  Progress: {total}/{total} (100%)")
-    result = pd.concat(all_features, ignore_index=True)
+    Sorts once by (stock, date), skipped if already in that order. The numba
+    engine runs the fused kernel in-process, threaded across stocks; n_jobs does
+    not apply to it (numba's thread count is set by NUMBA_NUM_THREADS). The
+    pandas engine splits stocks into size-balanced chunks processed across
+    n_jobs worker processes (defaults to all CPU cores).
+    """
+    n_jobs = n_jobs or os.cpu_count() or 1
+    # Group on integer category codes rather than hashing stock strings
+    if not isinstance(df[stock_column].dtype, pd.CategoricalDtype):
+        df = df.assign(**{stock_column: df[stock_column].astype('category')})
+    
+    if _is_sorted_by_stock_and_date(df, stock_column):
+        df = df.reset_index(drop=True)
+    else:
+        df = df.sort_values([stock_column, 'Date'], kind='mergesort', ignore_index=True)
+    
+    starts = _group_starts(df[stock_column])
+    print(f"Processing {len(starts) - 1} stocks ({engine} engine)...")
+    
+    if engine == 'numba' or n_jobs == 1:
+        result = _extract_chunk(df, stock_column, engine)
+    else:
+        chunks = _balance_stock_chunks(np.diff(starts), n_jobs)
+        # Each stock is a contiguous row range of the sorted frame: slice it
+        # rather than re-scanning the frame, and ship each worker only its rows
+        parts = Parallel(n_jobs=n_jobs, backend='loky')(
+            delayed(_extract_chunk)(
+                pd.concat([df.iloc[starts[g]:starts[g + 1]] for g in stocks]),
+                stock_column, engine
+            )
+            for stocks in chunks
+        )
+        # Restore the (stock, date) order of the sorted frame
+        result = pd.concat(parts).sort_index()
+    
     print(f"Total feature rows: {len(result):,}")
     
     return result
@@ -10,7 +10,7 @@ Usage:
 Output:
     artifacts/centroids.npy   - Cluster centers
     artifacts/patterns.json   - Pattern definitions + stats
-    artifacts/scaler.pkl      - StandardScaler for runtime matching
+    artifacts/scaler.npy      - Scaler mean/scale (2 x n_features) for runtime matching
 """
 
 import os
@@ -20,7 +20,18 @@ import pandas as pd
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import MiniBatchKMeans
 from sklearn.metrics import silhouette_score
-import joblib
+from scipy.optimize import linear_sum_assignment
+
+try:
+    import cuml
+    import cupy
+except ImportError:  # GPU clustering needs the RAPIDS stack (CUDA only)
+    cuml = None
+
+try:
+    import faiss
+except ImportError:  # faiss-cpu wheels are not published for every platform
+    faiss = None
 
 from feature_engineering import extract_features_batch
 
@@ -124,7 +135,11 @@ PATTERN_TEMPLATES = {
 def load_data(filepath: str) -> pd.DataFrame:
     """Load and validate the dataset."""
     print(f"Loading data from {filepath}...")
-    df = pd.read_csv(filepath)
+    if filepath.endswith('.parquet'):
+        # Columnar, multithreaded decode; see convert_to_parquet.py
+        df = pd.read_parquet(filepath, engine='pyarrow')
+    else:
+        df = pd.read_csv(filepath)
     
     # Validate required columns
     required = ['Date', 'Stock', 'Open', 'High', 'Low', 'Close', 'Volume']
@@ -132,60 +147,184 @@ def load_data(filepath: str) -> pd.DataFrame:
     if missing:
         raise ValueError(f"Missing columns: {missing}")
     
-    print(f"Loaded {len(df):,} rows, {df['Stock'].nunique()} stocks")
+    # Categorical: grouping and sorting by stock then work on int codes
+    df['Stock'] = df['Stock'].astype('category')
+    
+    print(f"Loaded {len(df):,} rows, {len(df['Stock'].cat.categories)} stocks")
     return df
 
 
 def prepare_features(df: pd.DataFrame) -> tuple:
     """Extract features and prepare for clustering."""
     print("\n=== Feature Engineering ===")
+    # Cast once: float32 is ample for these statistics and halves memory traffic
+    ohlcv = ['Open', 'High', 'Low', 'Close', 'Volume']
+    df[ohlcv] = df[ohlcv].astype(np.float32)
+    
     features_df = extract_features_batch(df)
     
     # Get feature columns (exclude metadata)
     feature_cols = [c for c in features_df.columns if c not in ['date', 'stock']]
     
-    # Drop rows with NaN (from rolling windows)
-    clean_df = features_df.dropna()
-    print(f"After dropping NaN: {len(clean_df):,} rows")
-    
-    X = clean_df[feature_cols].values
-    metadata = clean_df[['date', 'stock']].copy()
+    # Drop rows with NaN (from rolling windows) with a single row take.
+    # The take yields a fresh, writable X, which train_clustering scales in place.
+    X_all = features_df[feature_cols].to_numpy(copy=False)
+    valid = ~np.isnan(X_all).any(axis=1)
+    X = X_all[valid]
+    metadata = features_df.loc[valid, ['date', 'stock']]
+    print(f"After dropping NaN: {len(X):,} rows")
     
     return X, metadata, feature_cols
 
 
+def fit_scaler_inplace(X: np.ndarray) -> StandardScaler:
+    """
+    Standardize X in place and return the equivalent fitted StandardScaler.
+    Reductions accumulate in float64 without an (n, features) temporary
+    (X.var would build a float64 X - mean copy); X is centered in place first.
+    """
+    mean = X.mean(axis=0, dtype=np.float64)
+    np.subtract(X, mean, out=X, casting='same_kind')
+    
+    # Centering in X's dtype leaves a small residual mean; correct for it
+    residual = X.mean(axis=0, dtype=np.float64)
+    var = np.einsum('ij,ij->j', X, X, dtype=np.float64) / len(X) - residual ** 2
+    var = np.maximum(var, 0.0)
+    mean += residual
+    
+    scale = np.sqrt(var)
+    # Same convention as StandardScaler: constant features are left unscaled
+    scale[scale == 0.0] = 1.0
+    
+    np.subtract(X, residual, out=X, casting='same_kind')
+    np.divide(X, scale, out=X, casting='same_kind')
+    
+    scaler = StandardScaler()
+    scaler.mean_ = mean
+    scaler.var_ = var
+    scaler.scale_ = scale
+    scaler.n_features_in_ = X.shape[1]
+    scaler.n_samples_seen_ = len(X)
+    return scaler
+
+
+class FaissKMeans:
+    """
+    K-Means trained with faiss (multithreaded, SIMD L2 distances).
+    Exposes the sklearn attributes used downstream (cluster_centers_, predict).
+    predict searches the two nearest centroids and keeps their squared distances
+    in sq_distances_, so simplified_silhouette needs no second search.
+    """
+    
+    def __init__(self, n_clusters: int, n_iter: int = 50, n_redo: int = 3, seed: int = 42):
+        self.n_clusters = n_clusters
+        self.n_iter = n_iter
+        self.n_redo = n_redo
+        self.seed = seed
+        self.index = None
+        self.cluster_centers_ = None
+        self.sq_distances_ = None
+    
+    def fit(self, X: np.ndarray):
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        kmeans = faiss.Kmeans(
+            d=X.shape[1],
+            k=self.n_clusters,
+            niter=self.n_iter,
+            nredo=self.n_redo,
+            seed=self.seed,
+            # faiss subsamples to 256 points per centroid by default; train on all rows
+            max_points_per_centroid=-(-len(X) // self.n_clusters),
+            verbose=True
+        )
+        kmeans.train(X)
+        self.index = kmeans.index
+        self.cluster_centers_ = kmeans.centroids
+        return self
+    
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        sq_dist, nearest = self.index.search(np.ascontiguousarray(X, dtype=np.float32), 2)
+        self.sq_distances_ = sq_dist
+        return nearest[:, 0]
+    
+    def fit_predict(self, X: np.ndarray) -> np.ndarray:
+        return self.fit(X).predict(X)
+
+
+def simplified_silhouette(sq_dist: np.ndarray) -> float:
+    """
+    Centroid-based approximation of the silhouette score, over all rows.
+    Uses a = distance to own centroid and b = distance to the nearest other
+    centroid instead of mean pairwise distances: O(n*k) instead of O(n^2).
+    sq_dist holds each row's squared distances to its two nearest centroids
+    (FaissKMeans.sq_distances_).
+    """
+    dist = np.sqrt(np.maximum(sq_dist, 0))
+    a, b = dist[:, 0], dist[:, 1]
+    denominator = np.maximum(a, b)
+    scores = np.divide(b - a, denominator, out=np.zeros_like(a), where=denominator > 0)
+    return float(scores.mean())
+
+
 def train_clustering(X: np.ndarray, n_clusters: int = 9) -> tuple:
-    """Train MiniBatchKMeans clustering (fast for large datasets)."""
-    print(f"\n=== Training MiniBatchKMeans (k={n_clusters}) ===")
+    """
+    Train K-Means clustering on the GPU with cuML when available, else with
+    faiss, else with sklearn MiniBatchKMeans. X is standardized in place.
+    """
+    if cuml is not None:
+        backend = "cuML"
+    elif faiss is not None:
+        backend = "faiss"
+    else:
+        backend = "MiniBatchKMeans"
+    print(f"\n=== Training K-Means (k={n_clusters}, {backend}) ===")
     print(f"Dataset size: {len(X):,} samples")
     
     # Normalize features
     print("Normalizing features...")
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
-    
-    # Train MiniBatchKMeans (much faster than regular KMeans)
-    print("Clustering (this should take ~1-2 minutes)...")
-    kmeans = MiniBatchKMeans(
-        n_clusters=n_clusters, 
-        random_state=42, 
-        batch_size=10000,  # Process in batches
-        n_init=3,  # Fewer initializations
-        max_iter=100
-    )
-    labels = kmeans.fit_predict(X_scaled)
-    
-    # Evaluate on a sample (silhouette is slow on 4M rows)
+    scaler = fit_scaler_inplace(X)
+    X_scaled = X.astype(np.float32, copy=False)
+    
+    print("Clustering...")
+    if cuml is not None:
+        # cuML has no MiniBatchKMeans; full K-Means on the GPU is fast at this size.
+        # output_type='numpy' keeps cluster_centers_ and labels on the host.
+        kmeans = cuml.KMeans(
+            n_clusters=n_clusters,
+            random_state=42,
+            n_init=3,
+            max_iter=100,
+            output_type='numpy'
+        )
+        labels = kmeans.fit_predict(cupy.asarray(X_scaled))
+    elif faiss is not None:
+        kmeans = FaissKMeans(n_clusters=n_clusters, n_iter=50, n_redo=3, seed=42)
+        labels = kmeans.fit_predict(X_scaled)
+    else:
+        kmeans = MiniBatchKMeans(
+            n_clusters=n_clusters, 
+            random_state=42, 
+            batch_size=10000,  # Process in batches
+            n_init=3,  # Fewer initializations
+            max_iter=100
+        )
+        labels = kmeans.fit_predict(X_scaled)
+    
     print("Evaluating cluster quality...")
-    sample_size = min(100000, len(X_scaled))
-    sample_idx = np.random.choice(len(X_scaled), sample_size, replace=False)
-    silhouette = silhouette_score(X_scaled[sample_idx], labels[sample_idx])
-    print(f"Silhouette Score (sample): {silhouette:.3f}")
+    if isinstance(kmeans, FaissKMeans):
+        silhouette = simplified_silhouette(kmeans.sq_distances_)
+        print(f"Simplified Silhouette Score (centroid-based): {silhouette:.3f}")
+    else:
+        # Exact silhouette is O(n^2) in the sample size, so keep the sample small
+        sample_size = min(10000, len(X_scaled))
+        sample_idx = np.random.choice(len(X_scaled), sample_size, replace=False)
+        silhouette = silhouette_score(X_scaled[sample_idx], labels[sample_idx], metric='euclidean')
+        print(f"Silhouette Score (sample): {silhouette:.3f}")
     
     # Cluster distribution
-    unique, counts = np.unique(labels, return_counts=True)
+    counts = np.bincount(labels, minlength=n_clusters)
     print("Cluster distribution:")
-    for cluster, count in zip(unique, counts):
+    for cluster, count in enumerate(counts):
         print(f"  Cluster {cluster}: {count:,} samples ({count/len(labels)*100:.1f}%)")
     
     return kmeans, scaler, labels
@@ -194,72 +333,57 @@ def train_clustering(X: np.ndarray, n_clusters: int = 9) -> tuple:
 def map_clusters_to_patterns(kmeans, feature_cols: list) -> dict:
     """
     Map K-Means clusters to pattern definitions based on centroid characteristics.
-    This is a heuristic mapping based on feature interpretation.
+    This is a heuristic mapping based on feature interpretation: every cluster is
+    scored against every pattern, then the assignment maximizing the total score
+    is solved globally (Hungarian algorithm), independent of cluster order.
     """
-    centroids = kmeans.cluster_centers_
+    centroids = np.asarray(kmeans.cluster_centers_, dtype=np.float64)
     
-    # Feature index mapping
+    # Centroid columns per feature (missing features fall back to column 0)
     idx = {name: i for i, name in enumerate(feature_cols)}
+    def col(name):
+        return centroids[:, idx.get(name, 0)]
     
-    # Score each cluster for each pattern type
-    pattern_mapping = {}
-    used_patterns = set()
+    volatility = col('volatility_10d')
+    trend = col('trend_slope_10d')
+    momentum_5 = col('momentum_5d')
+    momentum_10 = col('momentum_10d')
+    compression = col('range_compression_10d')
+    volume = col('volume_ratio_10d')
+    drawdown = col('drawdown_20d')
     
-    for cluster_id in range(len(centroids)):
-        c = centroids[cluster_id]
-        
-        # Calculate pattern scores based on centroid values
-        scores = {}
-        
-        # P1: Low volatility, flat trend
-        scores['P1'] = -abs(c[idx.get('volatility_10d', 0)]) - abs(c[idx.get('trend_slope_10d', 0)])
-        
-        # P2: High volatility change (proxy: high vol with low trend)
-        scores['P2'] = c[idx.get('volatility_10d', 0)] - abs(c[idx.get('trend_slope_10d', 0)])
-        
-        # P3: Positive trend
-        scores['P3'] = c[idx.get('trend_slope_10d', 0)] + c[idx.get('momentum_10d', 0)]
-        
-        # P4: Negative trend
-        scores['P4'] = -c[idx.get('trend_slope_10d', 0)] - c[idx.get('momentum_10d', 0)]
-        
-        # P5: High volatility + low momentum persistence
-        scores['P5'] = c[idx.get('volatility_10d', 0)] + abs(c[idx.get('momentum_5d', 0)])
-        
-        # P6: Low volatility + compression
-        scores['P6'] = -c[idx.get('volatility_10d', 0)] - c[idx.get('range_compression_10d', 0)]
-        
-        # P7: High volume + drawdown
-        scores['P7'] = c[idx.get('volume_ratio_10d', 0)] + abs(c[idx.get('drawdown_20d', 0)])
-        
-        # P8: Low trend slope, moderate volatility
-        scores['P8'] = -abs(c[idx.get('trend_slope_10d', 0)]) + c[idx.get('volatility_10d', 0)] * 0.5
-        
-        # P9: Low volume
-        scores['P9'] = -c[idx.get('volume_ratio_10d', 0)]
-        
-        # Find best available pattern
-        sorted_patterns = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        for pattern_id, score in sorted_patterns:
-            if pattern_id not in used_patterns:
-                pattern_mapping[cluster_id] = pattern_id
-                used_patterns.add(pattern_id)
-                break
-    
-    return pattern_mapping
+    # (n_clusters, n_patterns) score matrix, one column per pattern
+    pattern_ids = list(PATTERN_TEMPLATES)
+    scores = np.stack([
+        -np.abs(volatility) - np.abs(trend),        # P1: Low volatility, flat trend
+        volatility - np.abs(trend),                 # P2: High vol with low trend
+        trend + momentum_10,                        # P3: Positive trend
+        -trend - momentum_10,                       # P4: Negative trend
+        volatility + np.abs(momentum_5),            # P5: High volatility + low persistence
+        -volatility - compression,                  # P6: Low volatility + compression
+        volume + np.abs(drawdown),                  # P7: High volume + drawdown
+        -np.abs(trend) + volatility * 0.5,          # P8: Low trend slope, moderate vol
+        -volume,                                    # P9: Low volume
+    ], axis=1)
+    
+    cluster_ids, pattern_cols = linear_sum_assignment(scores, maximize=True)
+    
+    return {int(c): pattern_ids[p] for c, p in zip(cluster_ids, pattern_cols)}
 
 
 def calculate_pattern_stats(labels: np.ndarray, metadata: pd.DataFrame, mapping: dict) -> dict:
     """Calculate statistics for each pattern from the data."""
     stats = {}
+    # All cluster sizes in one pass over labels
+    counts = np.bincount(labels, minlength=max(mapping) + 1)
+    total = counts.sum()
     
     for cluster_id, pattern_id in mapping.items():
-        cluster_mask = labels == cluster_id
-        count = cluster_mask.sum()
+        count = counts[cluster_id]
         
         stats[pattern_id] = {
             "sampleCount": int(count),
-            "percentage": round(count / len(labels) * 100, 2)
+            "percentage": round(count / total * 100, 2)
         }
     
     return stats
@@ -273,8 +397,10 @@ def save_artifacts(kmeans, scaler, pattern_mapping: dict, pattern_stats: dict,
     # Save centroids
     np.save(os.path.join(output_dir, "centroids.npy"), kmeans.cluster_centers_)
     
-    # Save scaler
-    joblib.dump(scaler, os.path.join(output_dir, "scaler.pkl"))
+    # Save scaler as a (2, n_features) float32 array: row 0 = mean, row 1 = scale.
+    # At inference: mean, scale = np.load("scaler.npy"); X_scaled = (X - mean) / scale
+    scaler_params = np.stack([scaler.mean_, scaler.scale_]).astype(np.float32)
+    np.save(os.path.join(output_dir, "scaler.npy"), scaler_params)
     
     # Save feature columns
     with open(os.path.join(output_dir, "feature_cols.json"), 'w') as f:
@@ -305,7 +431,9 @@ def main():
     print("=" * 60)
     
     # Configuration
-    DATA_PATH = "../stocks_df.csv"
+    DATA_PATH = "../stocks_df.parquet"
+    if not os.path.exists(DATA_PATH):
+        DATA_PATH = "../stocks_df.csv"
     N_CLUSTERS = 9
     OUTPUT_DIR = "artifacts"
     
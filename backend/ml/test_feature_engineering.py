@@ -0,0 +1,89 @@
+"""
+Tests for feature_engineering.py
+
+Usage:
+    cd backend/ml
+    python -m pytest test_feature_engineering.py
+"""
+
+import numpy as np
+import pandas as pd
+
+from feature_engineering import FEATURE_COLUMNS, extract_features_batch
+
+
+def make_ohlcv(stocks=('AAA', 'BBB'), n=30) -> pd.DataFrame:
+    """Small date-ordered OHLCV frame, one block of n rows per stock."""
+    rng = np.random.default_rng(0)
+    frames = []
+    for stock in stocks:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+        frames.append(pd.DataFrame({
+            'Date': pd.date_range('2024-01-01', periods=n).strftime('%Y-%m-%d'),
+            'Stock': stock,
+            'Open': close,
+            'High': close * 1.01,
+            'Low': close * 0.99,
+            'Close': close,
+            'Volume': rng.integers(1, 1000, n).astype(float),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_batch_handles_missing_date():
+    df = make_ohlcv()
+    df.loc[5, 'Date'] = np.nan
+
+    result = extract_features_batch(df)
+
+    assert len(result) == len(df)
+    assert result['date'].isna().sum() == 1
+
+
+def test_batch_output_independent_of_input_order():
+    df = make_ohlcv()
+    shuffled = df.sample(frac=1, random_state=1)
+
+    ordered = extract_features_batch(df)
+    unordered = extract_features_batch(shuffled)
+
+    pd.testing.assert_frame_equal(ordered, unordered)
+
+
+def make_edge_case_ohlcv(seed: int) -> pd.DataFrame:
+    """
+    Multi-stock frame covering the kernel edge cases: a NaN close, a zero close,
+    an all-zero volume run longer than 20 days and a stock shorter than 20 rows.
+    """
+    df = make_ohlcv(stocks=('AAA', 'BBB', 'CCC'), n=120)
+    rng = np.random.default_rng(seed)
+    df[['Open', 'High', 'Low', 'Close']] *= rng.uniform(0.5, 2.0)
+    
+    aaa = df.index[df['Stock'] == 'AAA']
+    df.loc[aaa[40], ['Open', 'High', 'Low', 'Close']] = np.nan
+    df.loc[aaa[80], 'Close'] = 0.0
+    bbb = df.index[df['Stock'] == 'BBB']
+    df.loc[bbb[30:60], 'Volume'] = 0.0
+    
+    short = make_ohlcv(stocks=('DDD',), n=12)
+    return pd.concat([df, short], ignore_index=True).sample(frac=1, random_state=seed)
+
+
+def test_numba_engine_matches_pandas_engine():
+    for seed in range(3):
+        df = make_edge_case_ohlcv(seed)
+        ohlcv = ['Open', 'High', 'Low', 'Close', 'Volume']
+        df[ohlcv] = df[ohlcv].astype(np.float32)
+        
+        fused = extract_features_batch(df, engine='numba')
+        reference = extract_features_batch(df, engine='pandas', n_jobs=1)
+        
+        pd.testing.assert_frame_equal(fused[['date', 'stock']], reference[['date', 'stock']])
+        for col in FEATURE_COLUMNS:
+            actual = fused[col].to_numpy(dtype=np.float64)
+            expected = reference[col].to_numpy(dtype=np.float64)
+            # Windows touching NaN or +-inf inputs are unusable in both engines
+            valid = np.isfinite(expected)
+            np.testing.assert_array_equal(np.isfinite(actual), valid, err_msg=col)
+            np.testing.assert_allclose(actual[valid], expected[valid],
+                                       rtol=1e-4, atol=1e-6, err_msg=col)